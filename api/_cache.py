@@ -0,0 +1,217 @@
+"""
+Caching utilities for Vercel serverless functions.
+Stores extracted paper text on disk and generated summaries in memory so
+warm instances can skip re-downloads and repeated AI calls.
+"""
+
+import os
+import time
+import logging
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from api._config import Config
+from api._utils import ServerBusyError
+
+logger = logging.getLogger(__name__)
+
+
+def _paper_text_path(arxiv_id: str) -> str:
+    """Return the cache file path for an arXiv paper's extracted text."""
+    return os.path.join(Config.PAPER_CACHE_DIR, f"{arxiv_id}.txt")
+
+
+def load_cached_paper_text(arxiv_id: str) -> Optional[str]:
+    """
+    Load previously extracted paper text from the disk cache.
+
+    Args:
+        arxiv_id: arXiv ID the text was extracted for
+
+    Returns:
+        Cached text or None if not cached
+    """
+    cache_path = _paper_text_path(arxiv_id)
+    try:
+        if time.time() - os.path.getmtime(cache_path) > Config.PAPER_CACHE_TTL:
+            os.remove(cache_path)
+            logger.info("Expired cached text for paper %s", arxiv_id)
+            return None
+        with open(cache_path, encoding="utf-8") as cache_file:
+            paper_text = cache_file.read()
+        logger.info("Loaded cached text for paper %s", arxiv_id)
+        return paper_text
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning("Failed to read paper cache for %s: %s", arxiv_id, e)
+        return None
+
+
+def store_cached_paper_text(arxiv_id: str, paper_text: str) -> None:
+    """
+    Atomically write extracted paper text to the disk cache.
+
+    Args:
+        arxiv_id: arXiv ID the text was extracted for
+        paper_text: Extracted text to cache
+    """
+    temp_path = None
+    try:
+        os.makedirs(Config.PAPER_CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=Config.PAPER_CACHE_DIR, suffix=".tmp", delete=False
+        ) as temp_file:
+            temp_path = temp_file.name
+            temp_file.write(paper_text)
+        os.replace(temp_path, _paper_text_path(arxiv_id))
+    except OSError as e:
+        logger.warning("Failed to write paper cache for %s: %s", arxiv_id, e)
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+        return
+    _prune_paper_cache()
+
+
+def _prune_paper_cache() -> None:
+    """Delete the oldest cached texts until the cache fits in PAPER_CACHE_MAX_BYTES."""
+    entries = []
+    try:
+        with os.scandir(Config.PAPER_CACHE_DIR) as it:
+            for entry in it:
+                if not entry.name.endswith(".txt"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError as e:
+        logger.warning("Failed to scan paper cache: %s", e)
+        return
+
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_bytes <= Config.PAPER_CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass  # Another worker evicted it first
+        except OSError as e:
+            logger.warning("Failed to evict %s from paper cache: %s", path, e)
+            continue
+        total_bytes -= size
+
+
+class TTLCache:
+    """Simple in-memory LRU cache with per-entry expiry (resets on cold starts)."""
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: int = 86400):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before the least recently used is evicted
+            ttl_seconds: Time in seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._store: Dict[Hashable, Tuple[float, Any]] = {}
+        self._in_flight: Dict[Hashable, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: Hashable) -> Optional[Any]:
+        """Return a live entry and mark it as recently used; caller holds the lock."""
+        entry = self._store.pop(key, None)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.time():
+            return None
+        self._store[key] = entry
+        return value
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for a key, marking it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing or expired
+        """
+        with self._lock:
+            return self._lookup(key)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry when the cache is full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        if self.maxsize <= 0:
+            # Caching is disabled
+            return
+        with self._lock:
+            self._store.pop(key, None)
+            if self._store and len(self._store) >= self.maxsize:
+                del self._store[next(iter(self._store))]
+            self._store[key] = (time.time() + self.ttl_seconds, value)
+
+    def get_or_create(
+        self, key: Hashable, factory: Callable[[], Any], timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Return the cached value for a key, computing it once on a miss.
+
+        Concurrent callers missing on the same key wait for the first one
+        instead of all running ``factory``. Exceptions are not cached; if
+        the first caller fails, a waiter takes over and runs ``factory``.
+
+        Args:
+            key: Cache key
+            factory: Callable producing the value on a miss
+            timeout: Seconds to wait for an in-flight computation, or None to wait indefinitely
+
+        Returns:
+            Cached or freshly computed value
+
+        Raises:
+            ServerBusyError: If the in-flight computation doesn't finish within ``timeout``
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self._lock:
+                value = self._lookup(key)
+                if value is not None:
+                    logger.info("Cache hit for %s", key)
+                    return value
+                in_flight = self._in_flight.get(key)
+                if in_flight is None:
+                    in_flight = self._in_flight[key] = threading.Event()
+                    break
+
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not in_flight.wait(remaining):
+                raise ServerBusyError("Server is busy processing this paper, please retry shortly")
+
+        try:
+            value = factory()
+            self.set(key, value)
+            return value
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            in_flight.set()
+
+
+# Global cache of generated summaries keyed by (arxiv_id, explanation_style)
+summary_cache = TTLCache(
+    maxsize=Config.SUMMARY_CACHE_SIZE, ttl_seconds=Config.SUMMARY_CACHE_TTL
+)
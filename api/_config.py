@@ -5,14 +5,20 @@ Adapted from the original backend config.py
 
 import os
 import logging
+import tempfile
 from google import genai
 
-# Configure logging for serverless environment
+# Configure logging for serverless environment (set LOG_LEVEL=WARNING in production)
+_log_level_name = (os.getenv("LOG_LEVEL") or "INFO").strip().upper()
+# getLevelName returns the numeric level for known names (getLevelNamesMapping needs 3.11)
+_log_level = logging.getLevelName(_log_level_name)
 logging.basicConfig(
-    level=logging.INFO,
+    level=_log_level if isinstance(_log_level, int) else logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+if not isinstance(_log_level, int):
+    logger.warning("Unknown LOG_LEVEL %r, falling back to INFO", _log_level_name)
 
 
 class Config:
@@ -26,9 +32,8 @@ class Config:
     
     # File size limits (adjusted for serverless)
     MAX_PDF_SIZE = 10 * 1024 * 1024  # 10MB limit for serverless
-    MAX_TEXT_LENGTH = 100000  # Maximum text length for API processing
+    MAX_TEXT_LENGTH = 100000  # Maximum text extracted from a PDF and sent to the AI
     MAX_PAGES = 50  # Reduced for serverless execution time limits
-    TEXT_LIMIT = 500000  # 500KB text limit
     
     # API limits
     MAX_FIGURES = 5
@@ -37,6 +42,24 @@ class Config:
     # Serverless specific settings
     MAX_EXECUTION_TIME = 25  # Vercel function timeout is 30s for hobby plan
 
+    # Concurrency limits for threaded servers (e.g. local Flask dev server)
+    MAX_CONCURRENT_PIPELINES = int(os.getenv("MAX_CONCURRENT_PIPELINES", "4"))
+    PIPELINE_WAIT_TIMEOUT = float(os.getenv("PIPELINE_WAIT_TIMEOUT", "10"))  # Seconds before answering 503
+
+    # Extracted paper text cache (shared by all workers on the same filesystem)
+    PAPER_CACHE_DIR = os.getenv(
+        "PAPER_CACHE_DIR", os.path.join(tempfile.gettempdir(), "rlif-paper-cache")
+    )
+    PAPER_CACHE_TTL = int(os.getenv("PAPER_CACHE_TTL", "86400"))  # 24 hours
+    PAPER_CACHE_MAX_BYTES = int(os.getenv("PAPER_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))  # 50MB
+
+    # Generated summary cache (per instance)
+    SUMMARY_CACHE_SIZE = int(os.getenv("SUMMARY_CACHE_SIZE", "1024"))
+    SUMMARY_CACHE_TTL = int(os.getenv("SUMMARY_CACHE_TTL", "86400"))  # 24 hours
+
+    # Memory housekeeping for warm instances
+    PDF_STORE_SHRINK_INTERVAL = max(1, int(os.getenv("PDF_STORE_SHRINK_INTERVAL", "10")))  # PDFs between MuPDF store flushes
+
 
 def get_gemini_client():
     """Initialize and return Gemini API client for serverless function."""
@@ -48,7 +71,7 @@ def get_gemini_client():
         logger.info("Gemini API client initialized successfully")
         return client
     except Exception as e:
-        logger.error(f"Error configuring Gemini API: {e}")
+        logger.error("Error configuring Gemini API: %s", e)
         raise RuntimeError(f"Failed to initialize Gemini API: {e}")
 
 
@@ -1,13 +1,18 @@
 """
 Rate limiting utilities for Vercel serverless functions.
-Implements in-memory rate limiting for API endpoints.
+Implements in-memory rate limiting for API endpoints, with an optional
+Redis backend so limits are shared across instances.
 """
 
+import os
 import time
+import uuid
 import logging
 from typing import Dict, Tuple, Optional, Any
 from datetime import datetime, timedelta
 
+import redis
+
 logger = logging.getLogger(__name__)
 
 # In-memory storage for rate limiting (resets on cold starts)
@@ -16,16 +21,19 @@ _rate_limit_store: Dict[str, Dict[str, Any]] = {}
 class RateLimiter:
     """Simple in-memory rate limiter for serverless functions."""
     
-    def __init__(self, requests_per_minute: int = 10, window_size_seconds: int = 60):
+    def __init__(self, requests_per_minute: int = 10, window_size_seconds: int = 60,
+                 namespace: str = "default"):
         """
         Initialize rate limiter.
         
         Args:
             requests_per_minute: Maximum requests allowed per minute
             window_size_seconds: Time window for rate limiting in seconds
+            namespace: Key namespace separating independent limiters
         """
         self.requests_per_minute = requests_per_minute
         self.window_size_seconds = window_size_seconds
+        self.namespace = namespace
     
     def is_allowed(self, client_id: str) -> Tuple[bool, Dict[str, Any]]:
         """
@@ -38,15 +46,16 @@ class RateLimiter:
             Tuple of (is_allowed: bool, rate_limit_info: dict)
         """
         current_time = time.time()
+        store_key = f"{self.namespace}:{client_id}"
         
         # Initialize client data if not exists
-        if client_id not in _rate_limit_store:
-            _rate_limit_store[client_id] = {
+        if store_key not in _rate_limit_store:
+            _rate_limit_store[store_key] = {
                 'requests': [],
                 'first_request_time': current_time
             }
         
-        client_data = _rate_limit_store[client_id]
+        client_data = _rate_limit_store[store_key]
         
         # Clean old requests outside the window
         cutoff_time = current_time - self.window_size_seconds
@@ -78,13 +87,139 @@ class RateLimiter:
         }
         
         if not is_allowed:
-            logger.warning(f"Rate limit exceeded for client {client_id}. Requests in window: {current_request_count}")
+            logger.warning("Rate limit exceeded for client %s. Requests in window: %s", client_id, current_request_count)
         
         return is_allowed, rate_limit_info
 
 
+# Sliding-window check run atomically inside Redis:
+# drop expired entries, count, conditionally record, and report the oldest entry
+_SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+local allowed = 0
+if count < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    allowed = 1
+end
+redis.call('EXPIRE', key, math.ceil(window))
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return {allowed, count, oldest[2] or tostring(now)}
+"""
+
+
+# Seconds to serve from the in-memory fallback after a Redis failure
+REDIS_FAILURE_COOLDOWN_SECONDS = 30
+
+# Time before which Redis is not retried (shared by all Redis limiters)
+_redis_retry_at = 0.0
+
+
+class RedisRateLimiter(RateLimiter):
+    """Sliding-window rate limiter backed by Redis sorted sets."""
+
+    def __init__(self, redis_client, requests_per_minute: int = 10,
+                 window_size_seconds: int = 60, namespace: str = "default"):
+        """
+        Initialize Redis-backed rate limiter.
+
+        Args:
+            redis_client: Connected redis.Redis client
+            requests_per_minute: Maximum requests allowed per minute
+            window_size_seconds: Time window for rate limiting in seconds
+            namespace: Key namespace separating independent limiters
+        """
+        super().__init__(requests_per_minute, window_size_seconds, namespace)
+        self._script = redis_client.register_script(_SLIDING_WINDOW_SCRIPT)
+
+    def is_allowed(self, client_id: str) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Check if a request from the client is allowed.
+
+        Falls back to the in-memory limiter if Redis is unavailable, and
+        keeps using it for a short cooldown before trying Redis again.
+
+        Args:
+            client_id: Unique identifier for the client (IP address, user ID, etc.)
+
+        Returns:
+            Tuple of (is_allowed: bool, rate_limit_info: dict)
+        """
+        global _redis_retry_at
+        current_time = time.time()
+        if current_time < _redis_retry_at:
+            return super().is_allowed(client_id)
+
+        key = f"ratelimit:{self.namespace}:{client_id}"
+
+        try:
+            allowed, current_request_count, oldest_request = self._script(
+                keys=[key],
+                args=[current_time, self.window_size_seconds,
+                      self.requests_per_minute, f"{current_time}:{uuid.uuid4().hex}"],
+            )
+        except Exception as e:
+            _redis_retry_at = current_time + REDIS_FAILURE_COOLDOWN_SECONDS
+            logger.error(
+                "Redis rate limiting failed, using in-memory fallback for %ss: %s",
+                REDIS_FAILURE_COOLDOWN_SECONDS, e,
+            )
+            return super().is_allowed(client_id)
+
+        is_allowed = bool(allowed)
+        reset_time = float(oldest_request) + self.window_size_seconds
+
+        rate_limit_info = {
+            'limit': self.requests_per_minute,
+            'remaining': max(0, self.requests_per_minute - current_request_count - (1 if is_allowed else 0)),
+            'reset': reset_time,
+            'retry_after': max(0, reset_time - current_time) if not is_allowed else 0
+        }
+
+        if not is_allowed:
+            logger.warning("Rate limit exceeded for client %s. Requests in window: %s", client_id, current_request_count)
+
+        return is_allowed, rate_limit_info
+
+
+# Cache Redis client initialization for serverless reuse
+_redis_client = None
+
+def get_redis_client():
+    """Get a cached Redis client if REDIS_URL is configured, otherwise None."""
+    global _redis_client
+    redis_url = os.getenv("REDIS_URL")
+    if _redis_client is None and redis_url:
+        _redis_client = redis.Redis.from_url(redis_url, socket_timeout=1)
+        logger.info("Redis rate limiting backend configured")
+    return _redis_client
+
+
+def create_rate_limiter(requests_per_minute: int = 10, window_size_seconds: int = 60,
+                        namespace: str = "default") -> RateLimiter:
+    """
+    Create a rate limiter, shared through Redis when REDIS_URL is configured.
+
+    Args:
+        requests_per_minute: Maximum requests allowed per minute
+        window_size_seconds: Time window for rate limiting in seconds
+        namespace: Key namespace separating independent limiters
+
+    Returns:
+        RedisRateLimiter if Redis is available, otherwise in-memory RateLimiter
+    """
+    redis_client = get_redis_client()
+    if redis_client is not None:
+        return RedisRateLimiter(redis_client, requests_per_minute, window_size_seconds, namespace)
+    return RateLimiter(requests_per_minute, window_size_seconds, namespace)
+
+
 # Global rate limiter instance
-default_rate_limiter = RateLimiter(requests_per_minute=5, window_size_seconds=60)
+default_rate_limiter = create_rate_limiter(requests_per_minute=5, window_size_seconds=60)
 
 def get_client_id(request) -> str:
     """
@@ -3,7 +3,6 @@ Shared utilities for Vercel serverless functions.
 Common helper functions used across API endpoints.
 """
 
-import json
 import logging
 from typing import Dict, Any, Optional
 import re
@@ -11,52 +10,21 @@ from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Cheap prefix check that rejects most non-arXiv input before any regex runs
+ARXIV_URL_PREFIXES = (
+    "https://arxiv.org/",
+    "http://arxiv.org/",
+    "https://www.arxiv.org/",
+    "http://www.arxiv.org/",
+)
 
-def safe_json_loads(json_string: str) -> Optional[Dict[str, Any]]:
-    """
-    Safely parse JSON string with error handling.
-    
-    Args:
-        json_string: JSON string to parse
-        
-    Returns:
-        Parsed dictionary or None if parsing fails
-    """
-    try:
-        return json.loads(json_string)
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse JSON: {e}")
-        return None
-
-
-def clean_json_response(response_text: str) -> str:
-    """
-    Clean JSON response by removing markdown formatting.
-    
-    Args:
-        response_text: Raw response text that may contain markdown
-        
-    Returns:
-        Cleaned JSON string
-    """
-    return response_text.strip().replace('```json', '').replace('```', '').strip()
+# Precompiled arXiv patterns used on every summarize request
+ARXIV_URL_RE = re.compile(r'^https?://(www\.)?arxiv\.org/(abs|pdf)/\d{4}\.\d{4,5}(v\d+)?/?(\.(pdf))?$')
+ARXIV_ID_RE = re.compile(r'(?:abs|pdf)/(\d{4}\.\d{4,5})(?:v\d+)?')
 
 
-def validate_required_fields(data: Dict[str, Any], required_fields: list) -> bool:
-    """
-    Validate that all required fields are present in a dictionary.
-    
-    Args:
-        data: Dictionary to validate
-        required_fields: List of required field names
-        
-    Returns:
-        True if all fields are present, raises ValueError otherwise
-    """
-    for field in required_fields:
-        if field not in data:
-            raise ValueError(f"Missing required field: {field}")
-    return True
+class ServerBusyError(RuntimeError):
+    """Raised when a request can't start processing within the configured wait."""
 
 
 def truncate_text(text: str, max_length: int, suffix: str = "\n\n[Text truncated due to length]") -> str:
@@ -86,8 +54,10 @@ def validate_arxiv_url(url: str) -> bool:
     Returns:
         True if valid arXiv URL
     """
-    arxiv_pattern = r'^https?://(www\.)?arxiv\.org/(abs|pdf)/\d{4}\.\d{4,5}(v\d+)?/?(\.(pdf))?$'
-    return bool(re.match(arxiv_pattern, url.strip()))
+    url = url.strip()
+    if not url.startswith(ARXIV_URL_PREFIXES):
+        return False
+    return bool(ARXIV_URL_RE.match(url))
 
 
 def extract_arxiv_id(url: str) -> Optional[str]:
@@ -100,7 +70,7 @@ def extract_arxiv_id(url: str) -> Optional[str]:
     Returns:
         arXiv ID or None if not found
     """
-    match = re.search(r'(?:abs|pdf)/(\d{4}\.\d{4,5})', url)
+    match = ARXIV_ID_RE.search(url)
     return match.group(1) if match else None
 
 